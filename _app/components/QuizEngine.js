@@ -7,6 +7,8 @@
  *       title: 'CIA Triad Challenge',
  *       description: 'Test your knowledge of security fundamentals',
  *       questions: [...],
+ *       // OR load a precompiled bank (see tools/quiz_banks.py):
+ *       // questionsUrl: '../../../quiz-banks/cia-triad.json',
  *       passingScore: 70,
  *       showFeedback: true,
  *       randomize: true,
@@ -24,6 +26,7 @@ class QuizEngine {
             title: config.title || 'Knowledge Check',
             description: config.description || '',
             questions: config.questions || [],
+            questionsUrl: config.questionsUrl || null,  // Lazy-loaded JSON question bank
             passingScore: config.passingScore || 70,
             showFeedback: config.showFeedback !== false,
             randomize: config.randomize !== false,
@@ -53,6 +56,7 @@ class QuizEngine {
 
         this.container = null;
         this.originalQuestions = [...this.config.questions];
+        this.questionsLoaded = !config.questionsUrl;  // Bank still to be fetched?
         this.progressResult = null;  // Store progress result for UI
     }
 
@@ -87,6 +91,32 @@ class QuizEngine {
             return;
         }
 
+        // Fetch the question bank on first start
+        if (this.config.questionsUrl && !this.questionsLoaded) {
+            this.container.innerHTML = `
+                <div class="quiz-loading" style="padding: 40px; text-align: center; color: #888;">Loading questions...</div>
+            `;
+            QuizEngine.loadBank(this.config.questionsUrl)
+                .then(questions => {
+                    this.config.questions = questions.map(q => ({ ...q }));
+                    this.originalQuestions = [...this.config.questions];
+                    this.questionsLoaded = true;
+                    this.start();
+                })
+                .catch(e => {
+                    console.error('[QuizEngine] Question bank error:', e);
+                    this.container.innerHTML = `
+                        <div style="padding: 40px; text-align: center; color: #f87171;">
+                            <h2>⚠️ Error</h2>
+                            <p>Could not load quiz questions.</p>
+                            <p style="font-size: 12px; color: #888;">${e.message}</p>
+                            <button onclick="location.reload()" style="margin-top: 20px; padding: 10px 20px;">Retry</button>
+                        </div>
+                    `;
+                });
+            return;
+        }
+
         // Reset state for retry
         this.state = {
             currentQuestion: 0,
@@ -117,6 +147,27 @@ class QuizEngine {
         this.startTimer();
     }
 
+    /**
+     * Fetch a JSON question bank, shared by every quiz on the page using the same URL
+     */
+    static loadBank(url) {
+        if (!QuizEngine.bankCache[url]) {
+            QuizEngine.bankCache[url] = fetch(url)
+                .then(response => {
+                    if (!response.ok) {
+                        throw new Error(`HTTP ${response.status} loading ${url}`);
+                    }
+                    return response.json();
+                })
+                .then(bank => Array.isArray(bank) ? bank : bank.questions)
+                .catch(e => {
+                    delete QuizEngine.bankCache[url];
+                    throw e;
+                });
+        }
+        return QuizEngine.bankCache[url];
+    }
+
     /**
      * Shuffle array (Fisher-Yates)
      */
@@ -879,6 +930,9 @@ class QuizEngine {
     }
 }
 
+// Question bank fetches keyed by URL
+QuizEngine.bankCache = {};
+
 // Export for module systems
 if (typeof module !== 'undefined' && module.exports) {
     module.exports = QuizEngine;
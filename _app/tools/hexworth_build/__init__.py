@@ -0,0 +1,60 @@
+"""
+hexworth_build - In-process library behind the Hexworth Prime build tools
+
+The command-line tools (content-encoder.py, inject-access-guard.py,
+brand_hashing.py, update_quizzes.py) are thin wrappers around this
+package. Other tooling can import it to run the same transforms over
+many pages in one process, reading each file once and writing all
+changes in a single batch:
+
+    from hexworth_build import DocumentStore, HOUSES_DIR, LANDING_PAGES, inject_access_guard
+
+    store = DocumentStore()
+    for doc in store.html_files(HOUSES_DIR, skip_names=LANDING_PAGES):
+        inject_access_guard(doc)
+    written, errors = store.commit()
+
+@author Hexworth Prime
+@version 1.0.0
+"""
+
+from .paths import (
+    APP_ROOT,
+    HOUSES_DIR,
+    DARK_ARTS_DIR,
+    CORE_FILES,
+    LANDING_PAGES,
+    get_relative_depth,
+    get_relative_path,
+    iter_html_files,
+)
+from .documents import Document, DocumentError, DocumentStore
+from .results import TransformResult
+from .encoding import encode_content, decode_content, encode_document, encode_html
+from .guard import determine_protection, get_guard_script, inject_access_guard
+from .branding import apply_shield_branding
+from .progress import add_progress_tracking
+
+__all__ = [
+    'APP_ROOT',
+    'HOUSES_DIR',
+    'DARK_ARTS_DIR',
+    'CORE_FILES',
+    'LANDING_PAGES',
+    'get_relative_depth',
+    'get_relative_path',
+    'iter_html_files',
+    'Document',
+    'DocumentError',
+    'DocumentStore',
+    'TransformResult',
+    'encode_content',
+    'decode_content',
+    'encode_document',
+    'encode_html',
+    'determine_protection',
+    'get_guard_script',
+    'inject_access_guard',
+    'apply_shield_branding',
+    'add_progress_tracking',
+]
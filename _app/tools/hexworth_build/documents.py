@@ -0,0 +1,177 @@
+"""
+documents.py - Cached HTML document store with lazy reads and batch commits
+
+Documents are read on first access to .text, cached by path and
+invalidated when the file changes on disk. Transforms assign .text;
+only documents whose text actually changed are marked dirty, and
+DocumentStore.commit() writes all of them in one pass. A dirty document
+whose file changed on disk is never written: the edit on disk wins and
+the pending text is reported as a DocumentError.
+"""
+
+import os
+from pathlib import Path
+
+from .paths import APP_ROOT, iter_html_files
+
+
+class DocumentError(Exception):
+    """Raised when a document cannot be read or written."""
+
+    def __init__(self, path, action, error):
+        super().__init__(f"ERROR {action}: {error}")
+        self.path = path
+        self.action = action
+        self.error = error
+
+
+class Document:
+    """A single file whose contents are loaded on first use."""
+
+    def __init__(self, path, store):
+        self.path = Path(path)
+        self.store = store
+        self._original = None
+        self._text = None
+        self._stamp = None
+
+    @property
+    def name(self):
+        return self.path.name
+
+    @property
+    def rel_path(self):
+        return self.path.relative_to(self.store.app_root)
+
+    @property
+    def loaded(self):
+        return self._original is not None
+
+    @property
+    def text(self):
+        if self._original is None:
+            self._load()
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        if self._original is None:
+            self._load()
+        self._text = value
+
+    @property
+    def dirty(self):
+        return self._original is not None and self._text != self._original
+
+    def revert(self):
+        """Discard uncommitted changes."""
+        self._text = self._original
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding=self.store.encoding, errors=self.store.errors) as f:
+                content = f.read()
+            self._stamp = _stat_key(self.path)
+        except Exception as e:
+            raise DocumentError(self.path, 'reading', e)
+        self._original = self._text = content
+
+    def _save(self):
+        try:
+            with open(self.path, 'w', encoding=self.store.encoding) as f:
+                f.write(self._text)
+            self._stamp = _stat_key(self.path)
+        except Exception as e:
+            raise DocumentError(self.path, 'writing', e)
+        self._original = self._text
+
+    def _is_stale(self):
+        return self.loaded and _stat_key(self.path) != self._stamp
+
+
+def _stat_key(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class DocumentStore:
+    """
+    Path -> Document cache rooted at the app directory.
+
+    store = DocumentStore()
+    for doc in store.html_files(HOUSES_DIR):
+        inject_access_guard(doc)
+    written, errors = store.commit()
+    """
+
+    def __init__(self, app_root=APP_ROOT, encoding='utf-8', errors='strict'):
+        self.app_root = Path(app_root)
+        self.encoding = encoding
+        self.errors = errors
+        self._documents = {}
+
+    def get(self, path):
+        """
+        Return the cached Document for a path, reloading it if it changed on
+        disk. Raises DocumentError if the cached copy had uncommitted changes;
+        those are discarded and the next get() returns the file on disk.
+        """
+        path = Path(path)
+        if not path.is_absolute():
+            path = self.app_root / path
+        doc = self._documents.get(path)
+        if doc is not None and doc.dirty and doc._is_stale():
+            self._discard(doc)
+            raise DocumentError(path, 'reading', 'changed on disk since read')
+        if doc is None or doc._is_stale():
+            doc = Document(path, self)
+            self._documents[path] = doc
+        return doc
+
+    def html_files(self, directory, skip_names=()):
+        """Documents for every .html file under a directory (not read until used)."""
+        for html_file in iter_html_files(directory, skip_names):
+            yield self.get(html_file)
+
+    def dirty(self):
+        return [doc for doc in self._documents.values() if doc.dirty]
+
+    def commit(self, dry_run=False):
+        """
+        Write every dirty document. Returns (written, errors) where errors
+        is a list of DocumentError; a failed write does not stop the batch.
+        Documents whose file changed on disk since it was read are not
+        written. They, and documents that fail to write, are dropped from
+        the cache so their stale text is never retried over later edits.
+        """
+        written = []
+        errors = []
+        for doc in self.dirty():
+            if doc._is_stale():
+                self._discard(doc)
+                errors.append(DocumentError(doc.path, 'writing', 'changed on disk since read'))
+                continue
+            if dry_run:
+                written.append(doc)
+                continue
+            try:
+                doc._save()
+                written.append(doc)
+            except DocumentError as e:
+                self._discard(doc)
+                errors.append(e)
+        return written, errors
+
+    def revert(self):
+        for doc in self.dirty():
+            doc.revert()
+
+    def _discard(self, doc):
+        doc.revert()
+        self._documents.pop(doc.path, None)
+
+    def __len__(self):
+        return len(self._documents)
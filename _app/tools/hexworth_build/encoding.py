@@ -0,0 +1,214 @@
+"""
+encoding.py - Content encryption transform (see content-encoder.py)
+
+Encoding Pipeline:
+1. Extract content from marked sections
+2. XOR encrypt with derived key
+3. Base64 encode for storage
+4. Replace original content with encrypted payload
+
+Key derivation must stay in sync with components/ContentDecoder.js.
+"""
+
+import re
+import base64
+import random
+import string
+
+from .paths import get_relative_path
+from .results import changed, skipped
+
+# Configuration
+MASTER_SALT = 'HexworthPrime2025'
+STORAGE_PREFIX = 'hexworth_'
+
+# Content markers
+ENCODE_CLASS = 'encode-content'
+ENCODE_START = '<!-- ENCODE-START -->'
+ENCODE_END = '<!-- ENCODE-END -->'
+
+# Scripts to inject
+DECODER_SCRIPT = '''
+    <script src="{path}components/ContentDecoder.js"></script>
+    <script>
+        // Auto-reveal after AccessGuard passes
+        if (typeof AccessGuard !== 'undefined') {{
+            ContentDecoder.autoReveal();
+        }}
+    </script>
+'''
+
+# ============================================
+# KEY DERIVATION (must match JavaScript)
+# ============================================
+
+def hash_string(s):
+    """
+    djb2 hash variant - must match JavaScript implementation
+    """
+    h = 5381
+    for c in s:
+        h = ((h << 5) + h + ord(c)) & 0xFFFFFFFF
+    return h & 0x7FFFFFFF
+
+def generate_key_bytes(hash_val, length):
+    """
+    Generate key bytes from hash - must match JavaScript
+    """
+    bytes_list = []
+    h = hash_val
+    for _ in range(length):
+        h = (h * 1103515245 + 12345) & 0x7FFFFFFF
+        bytes_list.append(h % 256)
+    return bytes_list
+
+def derive_key(salt='', house='', sorted_flag=True):
+    """
+    Derive encryption key from factors
+    For encoding, we use default values that will match decoded state
+    """
+    sorted_str = 'sorted' if sorted_flag else ''
+    key_material = '|'.join([MASTER_SALT, salt, house, sorted_str])
+    return hash_string(key_material)
+
+# ============================================
+# ENCRYPTION
+# ============================================
+
+def xor_encrypt(data_bytes, key_hash):
+    """
+    XOR encrypt/decrypt bytes with derived key
+    """
+    key_bytes = generate_key_bytes(key_hash, len(data_bytes))
+    result = bytearray(len(data_bytes))
+
+    for i, b in enumerate(data_bytes):
+        result[i] = b ^ key_bytes[i]
+
+    return bytes(result)
+
+def generate_salt(length=8):
+    """
+    Generate random salt for this content block
+    """
+    chars = string.ascii_letters + string.digits
+    return ''.join(random.choice(chars) for _ in range(length))
+
+def encode_content(content, salt=''):
+    """
+    Full encoding pipeline: content -> Base64 payload
+    """
+    encrypted = xor_encrypt(content.encode('utf-8'), derive_key(salt))
+    return base64.b64encode(encrypted).decode('ascii')
+
+def decode_content(payload, salt=''):
+    """
+    Decode for testing: Base64 payload -> content
+    """
+    decrypted = xor_encrypt(base64.b64decode(payload), derive_key(salt))
+    return decrypted.decode('utf-8')
+
+# ============================================
+# HTML PROCESSING
+# ============================================
+
+def find_encode_sections_by_class(html):
+    """
+    Find sections with class="encode-content"
+    Returns list of dicts with start, end, tag, content
+    """
+    pattern = r'<(\w+)[^>]*class="[^"]*\bencode-content\b[^"]*"[^>]*>(.*?)</\1>'
+    matches = []
+
+    for match in re.finditer(pattern, html, re.DOTALL | re.IGNORECASE):
+        matches.append({
+            'start': match.start(),
+            'end': match.end(),
+            'tag': match.group(1),
+            'content': match.group(2),
+            'full_match': match.group(0)
+        })
+
+    return matches
+
+def find_encode_sections_by_comment(html):
+    """
+    Find sections between ENCODE-START and ENCODE-END comments
+    """
+    pattern = r'<!-- ENCODE-START -->(.*?)<!-- ENCODE-END -->'
+    matches = []
+
+    for match in re.finditer(pattern, html, re.DOTALL):
+        matches.append({
+            'start': match.start(),
+            'end': match.end(),
+            'content': match.group(1).strip(),
+            'full_match': match.group(0)
+        })
+
+    return matches
+
+def create_protected_block(content, salt, tag='div'):
+    """
+    Create the protected content HTML block
+    """
+    payload = encode_content(content, salt)
+
+    protected = f'''<{tag} class="protected-content" data-payload="{payload}" data-salt="{salt}">
+        <div class="content-locked">
+            <span class="lock-icon">🔒</span>
+            <span class="lock-text">Protected Content</span>
+        </div>
+    </{tag}>'''
+
+    return protected
+
+def encode_html(html, rel_path, salt_factory=generate_salt):
+    """
+    Encrypt every marked section and add the ContentDecoder script.
+    Returns (new_html, sections) - sections is 0 if nothing was marked.
+    """
+    sections = find_encode_sections_by_class(html)
+    sections.extend(find_encode_sections_by_comment(html))
+
+    if not sections:
+        return html, 0
+
+    # Process sections in reverse order (to preserve positions)
+    sections.sort(key=lambda x: x['start'], reverse=True)
+
+    modified_html = html
+    for section in sections:
+        protected = create_protected_block(
+            section['content'], salt_factory(), section.get('tag', 'div'))
+        modified_html = (
+            modified_html[:section['start']] +
+            protected +
+            modified_html[section['end']:]
+        )
+
+    decoder_script = DECODER_SCRIPT.format(path=rel_path)
+
+    # Inject after AccessGuard script
+    if 'AccessGuard' in modified_html:
+        pattern = r'(AccessGuard\.require\([^)]+\);?\s*</script>)'
+        modified_html = re.sub(pattern, r'\1' + decoder_script, modified_html, count=1)
+    else:
+        modified_html = modified_html.replace('</head>', decoder_script + '\n</head>')
+
+    return modified_html, len(sections)
+
+def encode_document(doc, salt_factory=generate_salt):
+    """
+    Encode a Document in place
+    """
+    if 'ContentDecoder' in doc.text:
+        return skipped('already encoded')
+
+    rel_path = get_relative_path(doc.path, doc.store.app_root)
+    html, sections = encode_html(doc.text, rel_path, salt_factory)
+    if not sections:
+        return skipped('no encode markers')
+
+    doc.text = html
+    return changed(sections)
@@ -0,0 +1,85 @@
+"""
+guard.py - AccessGuard injection transform (see inject-access-guard.py)
+"""
+
+import re
+from pathlib import Path
+
+from .paths import get_relative_depth
+from .results import changed, skipped
+
+
+def get_guard_script(relative_depth, protection_type, protection_param=None):
+    """Generate the AccessGuard script block based on file location."""
+
+    # Calculate path to components directory
+    path_prefix = "../" * relative_depth
+
+    script = f'''
+    <!-- Access Control -->
+    <script src="{path_prefix}components/AccessGuard.js"></script>
+    <script>
+        AccessGuard.require('{protection_type}'{f", '{protection_param}'" if protection_param else ""});
+    </script>
+'''
+    return script.strip()
+
+
+def determine_protection(file_path, app_root):
+    """Determine the protection level based on file path."""
+
+    rel_path = Path(file_path).relative_to(app_root)
+    parts = rel_path.parts
+
+    # Dark Arts protection
+    if parts[0] == "dark-arts":
+        if "vault" in parts:
+            # Vault content requires all 5 gates
+            return ("dark-arts", None)
+        # Gate pages themselves - only require sorting
+        return ("sorted", None)
+
+    # House content protection
+    if parts[0] == "houses":
+        # For now, require sorting (not specific house)
+        # This allows cross-house exploration while still blocking direct access
+        return ("sorted", None)
+
+    return ("sorted", None)
+
+
+def insert_guard(html, guard_script):
+    """
+    Insert the guard after the charset meta tag, or after <head>.
+    Returns None if the page has neither.
+    """
+    charset_pattern = r'(<meta\s+charset=["\'][^"\']+["\']\s*/?>)'
+    match = re.search(charset_pattern, html, re.IGNORECASE)
+    if not match:
+        match = re.search(r'<head[^>]*>', html, re.IGNORECASE)
+    if not match:
+        return None
+
+    insert_pos = match.end()
+    return html[:insert_pos] + "\n    " + guard_script + html[insert_pos:]
+
+
+def inject_access_guard(doc):
+    """
+    Inject AccessGuard into a Document in place.
+    On success the result detail holds the protection type.
+    """
+    if 'AccessGuard' in doc.text:
+        return skipped('already protected')
+
+    app_root = doc.store.app_root
+    depth = get_relative_depth(doc.path, app_root)
+    protection_type, protection_param = determine_protection(doc.path, app_root)
+    guard_script = get_guard_script(depth, protection_type, protection_param)
+
+    html = insert_guard(doc.text, guard_script)
+    if html is None:
+        return skipped('no <head> found')
+
+    doc.text = html
+    return changed(detail=protection_type)
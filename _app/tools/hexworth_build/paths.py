@@ -0,0 +1,41 @@
+"""
+paths.py - Tree walking and relative-path helpers shared by the build tools
+"""
+
+from pathlib import Path
+
+# _app/ (this package lives in _app/tools/hexworth_build/)
+APP_ROOT = Path(__file__).resolve().parent.parent.parent
+
+HOUSES_DIR = APP_ROOT / "houses"
+DARK_ARTS_DIR = APP_ROOT / "dark-arts"
+
+# Pages that are never encoded (entry points and access-control pages)
+CORE_FILES = ('index.html', 'unauthorized.html', 'sorting.html', 'dashboard.html')
+
+# Landing pages are not content and are never guarded
+LANDING_PAGES = ('index.html',)
+
+
+def get_relative_depth(file_path, base_dir):
+    """Number of directories between base_dir and the file's directory."""
+    rel_path = Path(file_path).relative_to(base_dir)
+    return len(rel_path.parent.parts)
+
+
+def get_relative_path(file_path, app_root=APP_ROOT):
+    """
+    Prefix leading from a page back to the app root, e.g. '../../../'
+    for houses/shield/quizzes/page.html
+    """
+    return '../' * get_relative_depth(file_path, app_root)
+
+
+def iter_html_files(directory, skip_names=()):
+    """Yield every .html file under a directory, recursively."""
+    directory = Path(directory)
+    if not directory.exists():
+        return
+    for html_file in sorted(directory.rglob("*.html")):
+        if html_file.name not in skip_names:
+            yield html_file
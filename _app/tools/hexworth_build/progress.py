@@ -0,0 +1,59 @@
+"""
+progress.py - Progress System integration transform (see update_quizzes.py)
+"""
+
+import re
+
+from .paths import get_relative_path
+from .results import changed, skipped
+
+QUIZ_ENGINE_PATTERN = r'(<!-- Quiz Engine -->)\s*\n\s*(<script src="[^"]*QuizEngine\.js"></script>)'
+
+
+def add_progress_tracking(doc, module_id, house_id):
+    """
+    Load ProgressSystem.js before QuizEngine.js and add moduleId, houseId
+    and trackProgress to the QuizEngine config. The result detail is
+    'no config' when the script was added but the config was not found.
+    """
+    content = doc.text
+
+    # Check if already updated
+    if "ProgressSystem.js" in content:
+        return skipped('already updated')
+
+    rel_path = get_relative_path(doc.path, doc.store.app_root)
+
+    # Add ProgressSystem.js before QuizEngine.js
+    content = re.sub(
+        QUIZ_ENGINE_PATTERN,
+        r'<!-- Progress System (loads ProgressManager, AchievementSystem, LearningPaths, SkillTreeData) -->\n'
+        rf'    <script src="{rel_path}components/ProgressSystem.js"></script>\n\n    \1\n    \2',
+        content
+    )
+
+    tracking = (
+        "\n            // Progress tracking"
+        f"\n            moduleId: '{module_id}',"
+        f"\n            houseId: '{house_id}',"
+        "\n            trackProgress: true,"
+    )
+
+    # Look for the QuizEngine config and add after theme or achievement
+    detail = None
+    config_pattern = r"(theme:\s*'[^']*',\s*\n\s*)(achievement:\s*'[^']*',)"
+    if re.search(config_pattern, content):
+        content = re.sub(config_pattern, lambda m: m.group(1) + m.group(2) + tracking, content)
+    else:
+        # Try alternative pattern - just add after theme
+        config_pattern2 = r"(theme:\s*'[^']*',)"
+        if re.search(config_pattern2, content):
+            content = re.sub(config_pattern2, lambda m: m.group(1) + tracking, content)
+        else:
+            detail = 'no config'
+
+    if content == doc.text:
+        return skipped('no QuizEngine config found')
+
+    doc.text = content
+    return changed(detail=detail)
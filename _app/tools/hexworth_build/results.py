@@ -0,0 +1,18 @@
+"""
+results.py - Outcome of applying a transform to a document
+"""
+
+from collections import namedtuple
+
+# changed: document text was modified
+# detail:  why it was skipped, or transform-specific info when changed
+# count:   transform-specific amount, e.g. sections encoded
+TransformResult = namedtuple('TransformResult', ['changed', 'detail', 'count'])
+
+
+def changed(count=1, detail=None):
+    return TransformResult(True, detail, count)
+
+
+def skipped(reason):
+    return TransformResult(False, reason, 0)
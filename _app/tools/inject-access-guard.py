@@ -3,133 +3,72 @@
 inject-access-guard.py - Batch inject AccessGuard into content pages
 
 This script adds access control to all house content and Dark Arts pages.
-It injects the AccessGuard.js script and appropriate access checks.
+It injects the AccessGuard.js script and appropriate access checks; the
+transform itself is hexworth_build.guard.inject_access_guard.
 
 Usage:
-    python3 inject-access-guard.py [--dry-run]
+    python3 inject-access-guard.py [--dry-run] [--watch]
 
 Options:
     --dry-run    Show what would be changed without modifying files
+    --watch      Keep running and protect pages as they are added or edited
 """
 
-import os
-import re
 import sys
-from pathlib import Path
-
-# Configuration
-APP_ROOT = Path(__file__).parent.parent
-HOUSES_DIR = APP_ROOT / "houses"
-DARK_ARTS_DIR = APP_ROOT / "dark-arts"
-
-# Guard injection templates
-def get_guard_script(relative_depth, protection_type, protection_param=None):
-    """Generate the AccessGuard script block based on file location."""
-
-    # Calculate path to components directory
-    path_prefix = "../" * relative_depth
-
-    script = f'''
-    <!-- Access Control -->
-    <script src="{path_prefix}components/AccessGuard.js"></script>
-    <script>
-        AccessGuard.require('{protection_type}'{f", '{protection_param}'" if protection_param else ""});
-    </script>
-'''
-    return script.strip()
-
-
-def get_relative_depth(file_path, base_dir):
-    """Calculate how many directories deep the file is from base."""
-    rel_path = file_path.relative_to(base_dir)
-    return len(rel_path.parts)
-
-
-def determine_protection(file_path, app_root):
-    """Determine the protection level based on file path."""
-
-    rel_path = file_path.relative_to(app_root)
-    parts = rel_path.parts
-
-    # Dark Arts protection
-    if parts[0] == "dark-arts":
-        if "vault" in parts:
-            # Vault content requires all 5 gates
-            return ("dark-arts", None)
-        elif "gates" in parts or "gate-" in str(file_path):
-            # Gate pages themselves - only require sorting
-            return ("sorted", None)
-        else:
-            return ("sorted", None)
-
-    # House content protection
-    if parts[0] == "houses":
-        house_name = parts[1] if len(parts) > 1 else None
-        if house_name:
-            # For now, require sorting (not specific house)
-            # This allows cross-house exploration while still blocking direct access
-            return ("sorted", None)
 
-    return ("sorted", None)
+from hexworth_build import (
+    APP_ROOT,
+    DARK_ARTS_DIR,
+    HOUSES_DIR,
+    LANDING_PAGES,
+    DocumentError,
+    DocumentStore,
+    determine_protection,
+    inject_access_guard,
+)
 
 
-def inject_guard(file_path, app_root, dry_run=False):
+def inject_guard(file_path, app_root, dry_run=False, store=None):
     """Inject AccessGuard into a single HTML file."""
 
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        print(f"  ERROR reading: {e}")
-        return False
+    commit_now = store is None
+    if store is None:
+        store = DocumentStore(app_root)
 
-    # Skip if already has AccessGuard
-    if 'AccessGuard' in content:
-        print(f"  SKIP (already protected): {file_path.name}")
+    try:
+        doc = store.get(file_path)
+        result = inject_access_guard(doc)
+    except DocumentError as e:
+        print(f"  {e}")
         return False
 
-    # Calculate relative depth from _app directory
-    rel_to_app = file_path.relative_to(app_root)
-    depth = len(rel_to_app.parts)
-
-    # Determine protection type
-    protection_type, protection_param = determine_protection(file_path, app_root)
-
-    # Generate guard script
-    guard_script = get_guard_script(depth, protection_type, protection_param)
-
-    # Find injection point (after <head> or after first <meta charset>)
-    # Try to inject after charset meta tag
-    charset_pattern = r'(<meta\s+charset=["\'][^"\']+["\']\s*/?>)'
-    match = re.search(charset_pattern, content, re.IGNORECASE)
-
-    if match:
-        # Inject after charset meta
-        insert_pos = match.end()
-        new_content = content[:insert_pos] + "\n    " + guard_script + content[insert_pos:]
-    else:
-        # Fallback: inject after <head>
-        head_match = re.search(r'<head[^>]*>', content, re.IGNORECASE)
-        if head_match:
-            insert_pos = head_match.end()
-            new_content = content[:insert_pos] + "\n    " + guard_script + content[insert_pos:]
+    if not result.changed:
+        if result.detail == 'already protected':
+            print(f"  SKIP (already protected): {file_path.name}")
         else:
             print(f"  ERROR: No <head> found in {file_path.name}")
-            return False
+        return False
 
     if dry_run:
-        print(f"  WOULD INJECT ({protection_type}): {file_path.name}")
+        doc.revert()
+        print(f"  WOULD INJECT ({result.detail}): {file_path.name}")
         return True
 
-    # Write modified content
-    try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
-        print(f"  INJECTED ({protection_type}): {file_path.name}")
-        return True
-    except Exception as e:
-        print(f"  ERROR writing: {e}")
-        return False
+    if commit_now:
+        return commit_guarded(store) > 0
+    return True
+
+
+def commit_guarded(store):
+    """Write every guarded page in the store; returns the number written."""
+
+    written, errors = store.commit()
+    for doc in written:
+        protection_type, _ = determine_protection(doc.path, store.app_root)
+        print(f"  INJECTED ({protection_type}): {doc.name}")
+    for e in errors:
+        print(f"  {e}: {e.path.name}")
+    return len(written)
 
 
 def process_directory(directory, app_root, dry_run=False):
@@ -139,17 +78,42 @@ def process_directory(directory, app_root, dry_run=False):
         print(f"Directory not found: {directory}")
         return 0
 
+    store = DocumentStore(app_root)
     count = 0
-    for html_file in directory.rglob("*.html"):
+    for doc in store.html_files(directory):
         # Skip index.html files (they're landing pages, not content)
-        if html_file.name == "index.html":
-            print(f"  SKIP (landing page): {html_file.relative_to(app_root)}")
+        if doc.name in LANDING_PAGES:
+            print(f"  SKIP (landing page): {doc.rel_path}")
             continue
 
-        if inject_guard(html_file, app_root, dry_run):
+        if inject_guard(doc.path, app_root, dry_run, store):
             count += 1
 
-    return count
+    if dry_run:
+        return count
+    return commit_guarded(store)
+
+
+def watch_directories(app_root, dry_run=False):
+    """Inject AccessGuard into house and Dark Arts pages as they change."""
+    from site_watch import watch
+
+    roots = [d.relative_to(app_root).as_posix() for d in (HOUSES_DIR, DARK_ARTS_DIR)]
+
+    # One store for the whole session: unchanged pages are never re-read
+    store = DocumentStore(app_root)
+
+    def rebuild(paths):
+        changed = 0
+        for html_file in paths:
+            if html_file.name not in LANDING_PAGES:
+                if inject_guard(html_file, app_root, dry_run, store):
+                    changed += 1
+        if dry_run:
+            return changed
+        return commit_guarded(store)
+
+    watch(app_root, roots, rebuild)
 
 
 def main():
@@ -160,6 +124,10 @@ def main():
         print("DRY RUN MODE - No files will be modified")
         print("=" * 60)
 
+    if "--watch" in sys.argv:
+        watch_directories(APP_ROOT, dry_run)
+        return
+
     print(f"\nProcessing houses directory: {HOUSES_DIR}")
     print("-" * 60)
     houses_count = process_directory(HOUSES_DIR, APP_ROOT, dry_run)
@@ -0,0 +1,559 @@
+#!/usr/bin/env python3
+"""
+preview_server.py - Local static preview server with Firebase header parity
+
+Serves _app (or a build output directory) the way Firebase Hosting does,
+so caching and content-type behavior can be checked before deploying:
+
+1. Loads firebase.json and applies its hosting.headers rules (glob or
+   regex sources, later rules win) and hosting.ignore patterns
+2. Serves precompressed .br / .gz sidecars when the client accepts them
+   (Accept-Encoding q-values respected), and redirects directory URLs
+   without a trailing slash the way Hosting does
+3. Honors single byte ranges (audio/video seeking, PDF viewers)
+4. Answers If-None-Match / If-Modified-Since with 304
+5. Streams large files with zero-copy sendfile and keeps small hot files
+   in an in-memory LRU
+6. Logs per-request status, bytes and latency
+
+Usage:
+    python3 preview_server.py                       # Serve hosting.public on :5000
+    python3 preview_server.py --port 8080           # Different port
+    python3 preview_server.py --dir ../build        # Serve a build output
+    python3 preview_server.py --config path.json    # Different firebase.json
+    python3 preview_server.py --quiet               # No per-request log
+
+@author Hexworth Prime
+@version 1.0.0
+"""
+
+import re
+import sys
+import json
+import time
+import asyncio
+import hashlib
+import mimetypes
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+# Configuration
+APP_ROOT = Path(__file__).parent.parent
+FIREBASE_CONFIG = APP_ROOT.parent / 'firebase.json'
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 5000
+
+CACHE_MAX_BYTES = 64 * 1024 * 1024     # total LRU budget
+CACHE_MAX_FILE = 512 * 1024            # larger files are sent with sendfile
+MAX_HEADER_BYTES = 64 * 1024
+KEEP_ALIVE_TIMEOUT = 15
+
+# Sidecar suffix per Content-Encoding, in order of preference
+SIDECARS = (('br', '.br'), ('gzip', '.gz'))
+
+mimetypes.add_type('application/javascript', '.js')
+mimetypes.add_type('application/json', '.json')
+mimetypes.add_type('image/svg+xml', '.svg')
+mimetypes.add_type('font/woff2', '.woff2')
+mimetypes.add_type('audio/mpeg', '.mp3')
+
+STATUS_TEXT = {
+    200: 'OK',
+    206: 'Partial Content',
+    301: 'Moved Permanently',
+    304: 'Not Modified',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    416: 'Range Not Satisfiable',
+}
+
+# ============================================
+# FIREBASE CONFIG
+# ============================================
+
+def glob_to_regex(pattern):
+    """
+    Translate a Firebase (extglob-style) source glob to a regex
+    matched against the URL path without its leading slash
+    """
+    pattern = pattern.lstrip('/')
+    out = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern.startswith('**/', i):
+            out.append('(?:.*/)?')
+            i += 3
+            continue
+        if pattern.startswith('**', i):
+            out.append('.*')
+            i += 2
+            continue
+        if c == '*':
+            out.append('[^/]*')
+        elif c == '?':
+            out.append('[^/]')
+        elif c == '{':
+            end = pattern.find('}', i)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                options = pattern[i + 1:end].split(',')
+                out.append('(?:' + '|'.join(re.escape(o) for o in options) + ')')
+                i = end
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return re.compile('^' + ''.join(out) + '$')
+
+
+class HostingConfig:
+    """
+    The parts of firebase.json hosting config the preview honors
+    """
+
+    def __init__(self, public, header_rules, ignore, clean_urls=False):
+        self.public = public
+        self.header_rules = header_rules
+        self.ignore = ignore
+        self.clean_urls = clean_urls
+
+    @classmethod
+    def load(cls, config_path, public_override=None):
+        hosting = {}
+        if config_path and Path(config_path).exists():
+            with open(config_path, 'r', encoding='utf-8') as f:
+                hosting = json.load(f).get('hosting', {})
+            if isinstance(hosting, list):
+                hosting = hosting[0] if hosting else {}
+
+        base = Path(config_path).parent if config_path else Path.cwd()
+        public = Path(public_override) if public_override else base / hosting.get('public', '.')
+
+        header_rules = []
+        for rule in hosting.get('headers', []):
+            if 'regex' in rule:
+                matcher = re.compile(rule['regex'])
+            else:
+                matcher = glob_to_regex(rule.get('source', '**'))
+            headers = [(h['key'], h['value']) for h in rule.get('headers', [])]
+            header_rules.append((matcher, 'regex' in rule, headers))
+
+        ignore = [glob_to_regex(p) for p in hosting.get('ignore', [])]
+        return cls(public.resolve(), header_rules, ignore, hosting.get('cleanUrls', False))
+
+    def headers_for(self, url_path):
+        """
+        Custom headers for a request path; later rules override earlier keys
+        """
+        result = {}
+        for matcher, is_regex, headers in self.header_rules:
+            subject = url_path if is_regex else url_path.lstrip('/')
+            if matcher.search(subject) if is_regex else matcher.match(subject):
+                for key, value in headers:
+                    result[key.lower()] = (key, value)
+        return list(result.values())
+
+    def is_ignored(self, rel_path):
+        return any(p.match(rel_path) for p in self.ignore)
+
+# ============================================
+# FILE CACHE
+# ============================================
+
+class FileCache:
+    """
+    Byte-budgeted LRU of small file bodies keyed by (path, mtime_ns, size)
+    """
+
+    def __init__(self, max_bytes=CACHE_MAX_BYTES, max_file=CACHE_MAX_FILE):
+        self.max_bytes = max_bytes
+        self.max_file = max_file
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path, st):
+        key = (path, st.st_mtime_ns, st.st_size)
+        body = self.entries.get(key)
+        if body is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+        self.misses += 1
+        with open(path, 'rb') as f:
+            body = f.read()
+        self.entries[key] = body
+        self.size += len(body)
+        while self.size > self.max_bytes and self.entries:
+            _, old = self.entries.popitem(last=False)
+            self.size -= len(old)
+        return body
+
+# ============================================
+# REQUEST HANDLING
+# ============================================
+
+def content_type(path):
+    """
+    (Content-Type, Content-Encoding or None); a directly requested .gz or
+    .br file is typed by the name underneath the compression suffix
+    """
+    mime, encoding = mimetypes.guess_type(path.name)
+    mime = mime or 'application/octet-stream'
+    if mime.startswith('text/') or mime in ('application/javascript', 'application/json'):
+        mime += '; charset=utf-8'
+    return mime, encoding
+
+
+def accepted_encodings(value):
+    """
+    Parse Accept-Encoding into {coding: q}; codings with q=0 are refused
+    """
+    result = {}
+    for item in value.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            key, _, val = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    q = float(val)
+                except ValueError:
+                    q = 0.0
+        result[coding] = q
+    return result
+
+
+def etag_for(st, encoding=''):
+    raw = f"{st.st_mtime_ns}-{st.st_size}-{encoding}".encode('ascii')
+    return '"' + hashlib.md5(raw).hexdigest()[:16] + '"'
+
+
+def parse_range(value, size):
+    """
+    Parse a single 'bytes=' range; returns (start, end) inclusive,
+    None if absent/unsupported, or False if unsatisfiable
+    """
+    if not value or not value.startswith('bytes=') or ',' in value:
+        return None
+    start_s, _, end_s = value[6:].strip().partition('-')
+    try:
+        if start_s == '':
+            length = int(end_s)
+            if length <= 0:
+                return False
+            return max(0, size - length), size - 1
+        start = int(start_s)
+        end = int(end_s) if end_s else size - 1
+    except ValueError:
+        return None
+    if start >= size or end < start:
+        return False
+    return start, min(end, size - 1)
+
+
+def not_modified(headers, etag, mtime):
+    inm = headers.get('if-none-match')
+    if inm is not None:
+        return etag in [t.strip() for t in inm.split(',')] or inm.strip() == '*'
+    ims = headers.get('if-modified-since')
+    if ims:
+        try:
+            return int(mtime) <= parsedate_to_datetime(ims).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+class PreviewServer:
+    """
+    asyncio HTTP/1.1 static file server
+    """
+
+    def __init__(self, config, quiet=False):
+        self.config = config
+        self.root = config.public
+        self.cache = FileCache()
+        self.quiet = quiet
+
+    def locate(self, url_path):
+        """
+        Map a URL path to (target, rel_path) inside the root, or None
+        """
+        rel = unquote(url_path).lstrip('/')
+        if '\x00' in rel:
+            return None
+        target = (self.root / rel).resolve()
+        try:
+            rel_path = target.relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+        return target, rel_path
+
+    def is_directory_without_slash(self, url_path):
+        """
+        True for a directory URL lacking its trailing slash; Hosting
+        redirects these so relative links resolve inside the directory
+        """
+        if url_path.endswith('/'):
+            return False
+        located = self.locate(url_path)
+        return located is not None and located[0].is_dir()
+
+    def resolve(self, url_path):
+        """
+        Map a URL path to (file_path, rel_path) or None
+        """
+        located = self.locate(url_path)
+        if located is None:
+            return None
+        target, rel_path = located
+
+        if target.is_dir():
+            target = target / 'index.html'
+            rel_path = f"{rel_path}/index.html" if rel_path != '.' else 'index.html'
+        elif not target.exists() and self.config.clean_urls and not rel_path.endswith('.html'):
+            target = target.with_name(target.name + '.html')
+            rel_path += '.html'
+
+        if not target.is_file() or self.config.is_ignored(rel_path):
+            return None
+        return target, rel_path
+
+    def pick_variant(self, path, headers, use_range):
+        """
+        Choose a precompressed sidecar the client accepts, if present
+        """
+        if use_range:
+            return path, None
+        accepted = accepted_encodings(headers.get('accept-encoding', ''))
+        for encoding, suffix in SIDECARS:
+            if accepted.get(encoding, accepted.get('*', 0)) > 0:
+                sidecar = path.with_name(path.name + suffix)
+                if sidecar.is_file():
+                    return sidecar, encoding
+        return path, None
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(
+                        reader.readuntil(b'\r\n\r\n'), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError,
+                        asyncio.LimitOverrunError, ConnectionError):
+                    break
+
+                started = time.perf_counter()
+                keep_alive, status, sent, target = await self.respond(head, writer)
+                if not self.quiet:
+                    elapsed_ms = (time.perf_counter() - started) * 1000
+                    print(f"{status} {elapsed_ms:7.2f} ms {sent:>9} B  {target}")
+                if not keep_alive:
+                    break
+        finally:
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    async def respond(self, head, writer):
+        """
+        Serve one request; returns (keep_alive, status, bytes_sent, target)
+        """
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, target, version = lines[0].split(' ', 2)
+        except ValueError:
+            await self.send_error(writer, 400)
+            return False, 400, 0, lines[0]
+
+        headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                key, _, value = line.partition(':')
+                headers[key.strip().lower()] = value.strip()
+
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+        if method not in ('GET', 'HEAD'):
+            # Any request body is left unread, so the connection can't be reused
+            await self.send_error(writer, 405)
+            return False, 405, 0, target
+
+        url = urlsplit(target)
+        url_path = url.path or '/'
+        if self.is_directory_without_slash(url_path):
+            location = url_path + '/' + ('?' + url.query if url.query else '')
+            await self.send_head(writer, 301, [('Location', location)], 0, keep_alive)
+            return keep_alive, 301, 0, target
+
+        resolved = self.resolve(url_path)
+        if resolved is None:
+            status = await self.send_not_found(writer, url_path, method, keep_alive)
+            return keep_alive, status, 0, target
+
+        path, rel_path = resolved
+        range_header = headers.get('range')
+        body_path, encoding = self.pick_variant(path, headers, bool(range_header))
+        st = body_path.stat()
+        etag = etag_for(st, encoding or '')
+        mime, stored_encoding = content_type(path)
+        encoding = encoding or stored_encoding
+
+        response = [
+            ('Content-Type', mime),
+            ('Last-Modified', formatdate(st.st_mtime, usegmt=True)),
+            ('ETag', etag),
+            ('Accept-Ranges', 'bytes'),
+            ('Vary', 'Accept-Encoding'),
+        ]
+        if encoding:
+            response.append(('Content-Encoding', encoding))
+        response = self.merge_headers(response, self.config.headers_for(unquote(url_path)))
+
+        if not_modified(headers, etag, st.st_mtime):
+            await self.send_head(writer, 304, response, None, keep_alive)
+            return keep_alive, 304, 0, target
+
+        status = 200
+        offset, count = 0, st.st_size
+        byte_range = parse_range(range_header, st.st_size)
+        if byte_range is False:
+            response.append(('Content-Range', f"bytes */{st.st_size}"))
+            await self.send_head(writer, 416, response, 0, keep_alive)
+            return keep_alive, 416, 0, target
+        if byte_range:
+            status = 206
+            offset, end = byte_range
+            count = end - offset + 1
+            response.append(('Content-Range', f"bytes {offset}-{end}/{st.st_size}"))
+
+        await self.send_head(writer, status, response, count, keep_alive)
+        if method == 'HEAD' or count == 0:
+            return keep_alive, status, 0, target
+
+        if st.st_size <= self.cache.max_file:
+            body = self.cache.get(str(body_path), st)
+            writer.write(body[offset:offset + count])
+            await writer.drain()
+        else:
+            loop = asyncio.get_running_loop()
+            with open(body_path, 'rb') as f:
+                await loop.sendfile(writer.transport, f, offset, count)
+        return keep_alive, status, count, target
+
+    @staticmethod
+    def merge_headers(base, custom):
+        overridden = {key.lower() for key, _ in custom}
+        return [(k, v) for k, v in base if k.lower() not in overridden] + list(custom)
+
+    async def send_head(self, writer, status, headers, length, keep_alive):
+        lines = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}"]
+        lines.append(f"Date: {formatdate(usegmt=True)}")
+        lines.extend(f"{k}: {v}" for k, v in headers)
+        if length is not None:
+            lines.append(f"Content-Length: {length}")
+        lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        await writer.drain()
+
+    async def send_error(self, writer, status, keep_alive=False):
+        body = f"{status} {STATUS_TEXT.get(status, '')}\n".encode('ascii')
+        await self.send_head(writer, status, [('Content-Type', 'text/plain')],
+                             len(body), keep_alive)
+        writer.write(body)
+        await writer.drain()
+
+    async def send_not_found(self, writer, url_path, method, keep_alive):
+        page = self.root / '404.html'
+        if not page.is_file():
+            await self.send_error(writer, 404, keep_alive)
+            return 404
+        body = self.cache.get(str(page), page.stat())
+        headers = self.merge_headers([('Content-Type', 'text/html')],
+                                     self.config.headers_for('/404.html'))
+        await self.send_head(writer, 404, headers, len(body), keep_alive)
+        if method != 'HEAD':
+            writer.write(body)
+            await writer.drain()
+        return 404
+
+# ============================================
+# CLI
+# ============================================
+
+def print_help():
+    print("""
+preview_server.py - Serve _app locally with firebase.json header rules
+
+Usage:
+    python3 preview_server.py [--port N] [--host H] [--dir D] [--config F] [--quiet]
+
+Options:
+    --port N      Port to listen on (default 5000)
+    --host H      Interface to bind (default 127.0.0.1)
+    --dir D       Serve D instead of hosting.public (e.g. a build output)
+    --config F    firebase.json to read (default: repository root)
+    --quiet       Do not log each request
+""")
+
+
+def option(args, name, default=None):
+    if name in args:
+        idx = args.index(name)
+        if idx + 1 < len(args):
+            return args[idx + 1]
+    return default
+
+
+async def serve(config, host, port, quiet):
+    server = PreviewServer(config, quiet)
+    listener = await asyncio.start_server(server.handle, host, port, limit=MAX_HEADER_BYTES)
+    print(f"Serving {config.public} at http://{host}:{port}/")
+    print(f"  {len(config.header_rules)} header rule(s) from firebase.json")
+    async with listener:
+        await listener.serve_forever()
+
+
+def main():
+    args = sys.argv[1:]
+
+    if '--help' in args or '-h' in args:
+        print_help()
+        return 0
+
+    try:
+        port = int(option(args, '--port', DEFAULT_PORT))
+    except ValueError:
+        print("ERROR: --port requires a number")
+        return 2
+    host = option(args, '--host', DEFAULT_HOST)
+    config_path = Path(option(args, '--config', FIREBASE_CONFIG))
+    public = option(args, '--dir')
+
+    config = HostingConfig.load(config_path, public)
+    if not config.public.is_dir():
+        print(f"Directory not found: {config.public}")
+        return 2
+
+    try:
+        asyncio.run(serve(config, host, port, '--quiet' in args))
+    except KeyboardInterrupt:
+        print("\nStopped.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+"""
+quiz_banks.py - Extract inline QuizEngine question banks to JSON
+
+Quiz pages embed their whole question array in the page script. This tool
+moves each bank into a compact JSON file under _app/quiz-banks/ and
+rewrites the page to lazy-load it via QuizEngine's questionsUrl option:
+
+1. Find pages that load QuizEngine.js
+2. Locate the bank: an inline `questions: [...]` in the QuizEngine config,
+   or `questions: someVar` pointing at `const someVar = [...]`
+3. Parse the JavaScript literal (no Node required) and validate the schema
+4. Write quiz-banks/<id>.json; identical banks share one file
+5. Replace the literal with `questionsUrl: '<relative path>'`
+
+Pages are small again, banks are cached independently by the browser, and
+a bank reused across pages is only downloaded once.
+
+Browsers refuse fetch() for pages opened via file://, so run the rewrite
+on the copy being deployed (or served by preview_server.py), not on the
+working tree people open through START.html.
+
+Usage:
+    python3 quiz_banks.py                    # Extract + rewrite houses/ and dark-arts/
+    python3 quiz_banks.py [file.html ...]    # Specific pages
+    python3 quiz_banks.py --dry-run          # Preview without writing
+    python3 quiz_banks.py --no-rewrite       # Write JSON, leave pages untouched
+    python3 quiz_banks.py --check            # Validate banks only (exit 1 on errors)
+
+@author Hexworth Prime
+@version 1.0.0
+"""
+
+import re
+import sys
+import json
+import hashlib
+from pathlib import Path
+
+from hexworth_build import DocumentError, DocumentStore, get_relative_path, iter_html_files
+
+# Configuration
+APP_ROOT = Path(__file__).parent.parent
+BANKS_DIR = 'quiz-banks'
+SCAN_DIRS = ['houses', 'dark-arts']
+
+ENGINE_SCRIPT = 'QuizEngine.js'
+INLINE_PATTERN = re.compile(r'\bquestions\s*:\s*\[')
+VARIABLE_PATTERN = re.compile(r'\bquestions\s*:\s*([A-Za-z_$][\w$]*)\s*(?=[,}\n])')
+MODULE_ID_PATTERN = re.compile(r'\bmoduleId\s*:\s*[\'"]([^\'"]+)[\'"]')
+
+# Question schema (see QuizEngine.renderQuestion)
+REQUIRED_FIELDS = {'question': str, 'options': list, 'correct': int}
+OPTIONAL_FIELDS = {'explanation': str, 'code': str, 'image': str, 'preserveOrder': bool}
+
+
+class BankError(Exception):
+    """Raised when a question bank cannot be parsed or fails validation"""
+
+# ============================================
+# JAVASCRIPT LITERAL PARSER
+# ============================================
+
+class LiteralParser:
+    """
+    Parses the JSON-like subset of JavaScript used for question banks:
+    objects (bare or quoted keys), arrays, '/"/` strings, numbers,
+    true/false/null, trailing commas and comments
+    """
+
+    ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+    NUMBER = re.compile(r'-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+    IDENT = re.compile(r'[A-Za-z_$][\w$]*')
+
+    def __init__(self, text, pos=0):
+        self.text = text
+        self.pos = pos
+
+    def error(self, message):
+        line = self.text.count('\n', 0, self.pos) + 1
+        return BankError(f"line {line}: {message}")
+
+    def skip(self):
+        text = self.text
+        while self.pos < len(text):
+            c = text[self.pos]
+            if c in ' \t\r\n':
+                self.pos += 1
+            elif text.startswith('//', self.pos):
+                end = text.find('\n', self.pos)
+                self.pos = len(text) if end == -1 else end
+            elif text.startswith('/*', self.pos):
+                end = text.find('*/', self.pos + 2)
+                if end == -1:
+                    raise self.error("unterminated comment")
+                self.pos = end + 2
+            else:
+                break
+
+    def peek(self):
+        self.skip()
+        return self.text[self.pos] if self.pos < len(self.text) else ''
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise self.error(f"expected '{char}'")
+        self.pos += 1
+
+    def value(self):
+        c = self.peek()
+        if c == '[':
+            return self.array()
+        if c == '{':
+            return self.object()
+        if c in '\'"`':
+            return self.string()
+        match = self.NUMBER.match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+            raw = match.group(0)
+            return float(raw) if any(ch in raw for ch in '.eE') else int(raw)
+        match = self.IDENT.match(self.text, self.pos)
+        if match and match.group(0) in ('true', 'false', 'null'):
+            self.pos = match.end()
+            return {'true': True, 'false': False, 'null': None}[match.group(0)]
+        raise self.error("unsupported expression (only literals can be extracted)")
+
+    def array(self):
+        self.expect('[')
+        items = []
+        while self.peek() != ']':
+            items.append(self.value())
+            if self.peek() == ',':
+                self.pos += 1
+            elif self.peek() != ']':
+                raise self.error("expected ',' or ']'")
+        self.pos += 1
+        return items
+
+    def object(self):
+        self.expect('{')
+        obj = {}
+        while self.peek() != '}':
+            c = self.peek()
+            if c in '\'"':
+                key = self.string()
+            else:
+                match = self.IDENT.match(self.text, self.pos)
+                if not match:
+                    raise self.error("expected property name")
+                key = match.group(0)
+                self.pos = match.end()
+            self.expect(':')
+            obj[key] = self.value()
+            if self.peek() == ',':
+                self.pos += 1
+            elif self.peek() != '}':
+                raise self.error("expected ',' or '}'")
+        self.pos += 1
+        return obj
+
+    def string(self):
+        quote = self.text[self.pos]
+        self.pos += 1
+        out = []
+        text = self.text
+        while self.pos < len(text):
+            c = text[self.pos]
+            if c == quote:
+                self.pos += 1
+                return ''.join(out)
+            if c == '\\':
+                nxt = text[self.pos + 1:self.pos + 2]
+                if nxt == 'u':
+                    out.append(chr(int(text[self.pos + 2:self.pos + 6], 16)))
+                    self.pos += 6
+                    continue
+                if nxt == 'x':
+                    out.append(chr(int(text[self.pos + 2:self.pos + 4], 16)))
+                    self.pos += 4
+                    continue
+                if nxt == '\n':
+                    self.pos += 2
+                    continue
+                out.append(self.ESCAPES.get(nxt, nxt))
+                self.pos += 2
+                continue
+            if quote == '`' and text.startswith('${', self.pos):
+                raise self.error("template literal interpolation is not supported")
+            if c == '\n' and quote != '`':
+                raise self.error("unterminated string")
+            out.append(c)
+            self.pos += 1
+        raise self.error("unterminated string")
+
+
+def parse_literal(text, pos):
+    """
+    Parse the literal starting at text[pos]; returns (value, end_pos)
+    """
+    parser = LiteralParser(text, pos)
+    value = parser.value()
+    return value, parser.pos
+
+# ============================================
+# VALIDATION
+# ============================================
+
+def validate_bank(questions):
+    """
+    Return (errors, warnings) for a question bank
+    """
+    errors = []
+    warnings = []
+
+    if not isinstance(questions, list) or not questions:
+        return ["bank must be a non-empty array"], warnings
+
+    for i, q in enumerate(questions, 1):
+        where = f"question {i}"
+        if not isinstance(q, dict):
+            errors.append(f"{where}: not an object")
+            continue
+
+        for field, kind in REQUIRED_FIELDS.items():
+            if field not in q:
+                errors.append(f"{where}: missing '{field}'")
+            elif not isinstance(q[field], kind) or isinstance(q[field], bool) != (kind is bool):
+                errors.append(f"{where}: '{field}' must be {kind.__name__}")
+
+        for field, kind in OPTIONAL_FIELDS.items():
+            if field in q and not isinstance(q[field], kind):
+                errors.append(f"{where}: '{field}' must be {kind.__name__}")
+
+        for field in q.keys() - REQUIRED_FIELDS.keys() - OPTIONAL_FIELDS.keys():
+            warnings.append(f"{where}: unknown field '{field}'")
+
+        options = q.get('options')
+        if isinstance(options, list):
+            if len(options) < 2:
+                errors.append(f"{where}: needs at least 2 options")
+            if not all(isinstance(o, str) for o in options):
+                errors.append(f"{where}: options must be strings")
+            if len(set(map(str, options))) != len(options):
+                # Shuffling relies on options[correct] being unique
+                errors.append(f"{where}: duplicate options")
+            correct = q.get('correct')
+            if isinstance(correct, int) and not 0 <= correct < len(options):
+                errors.append(f"{where}: 'correct' index {correct} out of range")
+
+    return errors, warnings
+
+# ============================================
+# PAGE PROCESSING
+# ============================================
+
+def find_bank(html):
+    """
+    Locate the question literal in a page.
+    Returns dict(start, end, replace_start, replace_end, variable) or None
+    """
+    engine_at = html.find('new QuizEngine(')
+
+    match = INLINE_PATTERN.search(html, max(engine_at, 0))
+    if match:
+        start = match.end() - 1
+        return {'start': start, 'replace_start': match.start(), 'variable': None}
+
+    match = VARIABLE_PATTERN.search(html, max(engine_at, 0))
+    if not match:
+        return None
+
+    name = match.group(1)
+    decl = re.search(r'\b(?:const|let|var)\s+' + re.escape(name) + r'\s*=\s*\[', html)
+    if not decl:
+        return None
+    return {
+        'start': decl.end() - 1,
+        'replace_start': match.start(),
+        'replace_end': match.end(),
+        'decl_start': decl.start(),
+        'variable': name,
+    }
+
+
+def bank_id(html, file_path, app_root):
+    """
+    Stable id for a page's bank: its moduleId, else a path-derived slug
+    """
+    match = MODULE_ID_PATTERN.search(html)
+    if match:
+        return match.group(1)
+    rel = file_path.relative_to(app_root)
+    parts = rel.parts[1:] if rel.parts[0] == 'houses' else rel.parts
+    house, stem = parts[0], rel.stem
+    return stem if stem.startswith(house) else f"{house}-{stem}"
+
+
+def rewrite_page(html, bank, questions_end, url):
+    """
+    Replace the inline bank with a questionsUrl reference
+    """
+    reference = f"questionsUrl: '{url}'"
+
+    if bank['variable'] is None:
+        return html[:bank['replace_start']] + reference + html[questions_end:]
+
+    # Drop the `const name = [...];` declaration (and its line) and point
+    # the config at the URL
+    decl_start = bank['decl_start']
+    decl_end = questions_end
+    tail = re.match(r'[ \t]*;?[ \t]*\n?', html[decl_end:])
+    decl_end += tail.end()
+    line_start = html.rfind('\n', 0, decl_start) + 1
+    if not html[line_start:decl_start].strip():
+        decl_start = line_start
+
+    edits = sorted([
+        (decl_start, decl_end, ''),
+        (bank['replace_start'], bank['replace_end'], reference),
+    ], reverse=True)
+    for start, end, text in edits:
+        html = html[:start] + text + html[end:]
+    return html
+
+
+def relative_url(file_path, target, app_root):
+    """
+    URL from a page to a file, both absolute paths inside the app root
+    """
+    return get_relative_path(file_path, app_root) + target.relative_to(app_root).as_posix()
+
+
+def process_file(doc, written, dry_run=False, rewrite=True, check=False):
+    """
+    Extract a single quiz page and (optionally) rewrite the Document.
+    `written` maps content hash -> bank path so identical banks are shared.
+    Returns the number of questions extracted, or -1 on error.
+    """
+    file_path = doc.path
+    app_root = doc.store.app_root
+    try:
+        html = doc.text
+    except DocumentError as e:
+        print(f"  {e}")
+        return -1
+
+    rel = file_path.relative_to(app_root)
+
+    if ENGINE_SCRIPT not in html:
+        return 0
+
+    bank = find_bank(html)
+    if bank is None:
+        if 'questionsUrl' in html:
+            print(f"  SKIP (already external): {rel}")
+        else:
+            print(f"  SKIP (no inline bank): {rel}")
+        return 0
+
+    if bank['variable']:
+        uses = len(re.findall(r'\b' + re.escape(bank['variable']) + r'\b', html))
+        if uses != 2:
+            print(f"  SKIP ('{bank['variable']}' used elsewhere in page): {rel}")
+            rewrite = False
+
+    try:
+        questions, end = parse_literal(html, bank['start'])
+    except BankError as e:
+        print(f"  ERROR parsing {rel}: {e}")
+        return -1
+
+    errors, warnings = validate_bank(questions)
+    for w in warnings:
+        print(f"  WARN {rel}: {w}")
+    if errors:
+        for e in errors:
+            print(f"  INVALID {rel}: {e}")
+        return -1
+
+    if check:
+        print(f"  OK ({len(questions)} questions): {rel}")
+        return len(questions)
+
+    payload = json.dumps({'questions': questions}, ensure_ascii=False, separators=(',', ':'))
+    digest = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    target = written.get(digest)
+    if target is None:
+        target = app_root / BANKS_DIR / f"{bank_id(html, file_path, app_root)}.json"
+        n = 2
+        while target in written.values() or (target.exists() and target.read_text(encoding='utf-8') != payload):
+            target = target.with_name(f"{target.stem.rsplit('--', 1)[0]}--{n}.json")
+            n += 1
+        written[digest] = target
+        if not dry_run:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with open(target, 'w', encoding='utf-8') as f:
+                f.write(payload)
+
+    url = relative_url(file_path, target, app_root)
+    action = 'WOULD EXTRACT' if dry_run else 'EXTRACTED'
+    print(f"  {action} ({len(questions)} questions -> {target.relative_to(app_root)}): {rel}")
+
+    if rewrite and not dry_run:
+        doc.text = rewrite_page(html, bank, end, url)
+
+    return len(questions)
+
+
+def find_quiz_pages(app_root):
+    pages = []
+    for name in SCAN_DIRS:
+        pages.extend(iter_html_files(app_root / name))
+    return pages
+
+# ============================================
+# CLI
+# ============================================
+
+def main():
+    args = sys.argv[1:]
+
+    if '--help' in args or '-h' in args:
+        print(__doc__)
+        return 0
+
+    dry_run = '--dry-run' in args
+    rewrite = '--no-rewrite' not in args
+    check = '--check' in args
+    files = [Path(a).resolve() for a in args if not a.startswith('--')]
+
+    if dry_run:
+        print("=" * 60)
+        print("DRY RUN MODE - No files will be modified")
+        print("=" * 60)
+
+    app_root = APP_ROOT.resolve()
+    pages = files or find_quiz_pages(app_root)
+
+    store = DocumentStore(app_root)
+    written = {}
+    banks = questions = failures = 0
+    for page in pages:
+        count = process_file(store.get(page), written, dry_run, rewrite, check)
+        if count < 0:
+            failures += 1
+        elif count > 0:
+            banks += 1
+            questions += count
+
+    # Pages are only rewritten once every bank has been written
+    _, errors = store.commit()
+    for e in errors:
+        print(f"  {e}: {e.path.relative_to(app_root)}")
+        failures += 1
+
+    print("\n" + "=" * 60)
+    print(f"Banks: {banks}  Questions: {questions}  Bank files: {len(written)}  Errors: {failures}")
+    print("=" * 60)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,698 @@
+#!/usr/bin/env python3
+"""
+site_audit.py - Content audit engine backed by a cached file index
+
+Replaces the separate Node audit scripts (audit-registry.js,
+audit-house-indexes.js, audit-categories.js, house-summary.js) with one
+engine that scans _app once and answers every report from the same index.
+
+The index is persisted to _app/.site-index.json. Each file entry is keyed
+by (mtime_ns, size), and parsed results for content-registry.js and the
+house index.html pages are only recomputed when that key changes, so warm
+runs are a single directory walk plus a JSON load.
+
+Houses are discovered from disk instead of being hard-coded: every
+directory under houses/ is a house, and a top-level directory with the
+same name (dark-arts/) takes precedence as that house's content root.
+An index without SAMPLE_MODULES (the Dark Arts vault) is audited by the
+pages it links to with href="..." or location.href='...'.
+
+Usage:
+    python3 site_audit.py                      # All reports
+    python3 site_audit.py missing              # Registry paths missing on disk
+    python3 site_audit.py summary [house]      # Per-house / per-category counts
+    python3 site_audit.py indexes [house]      # Orphaned files and broken hrefs
+    python3 site_audit.py categories [house]   # SAMPLE_MODULES category audit
+    python3 site_audit.py unregistered [house] # Pages not linked anywhere
+    python3 site_audit.py --json [...]         # Emit JSON for dashboards
+    python3 site_audit.py --rebuild [...]      # Ignore the cached index
+
+@author Hexworth Prime
+@version 1.0.0
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import fnmatch
+import posixpath
+from pathlib import Path
+
+# Configuration
+APP_ROOT = Path(__file__).parent.parent
+INDEX_FILE = '.site-index.json'
+INDEX_VERSION = 3
+
+REGISTRY_PATH = 'config/content-registry.js'
+HOUSES_DIR = 'houses'
+
+# Directories never worth indexing
+SKIP_DIRS = {'.git', 'node_modules', '__pycache__', '.firebase'}
+
+# Registry component keys that point at files
+REGISTRY_PATH_PATTERN = re.compile(r'(?:presentation|applet|lab|quiz):\s*[\'"]([^\'"]+)[\'"]')
+
+# House index.html patterns (same as the Node scripts)
+HREF_PATTERN = re.compile(r'href:\s*[\'"]([^\'"]+)[\'"]')
+CATEGORIES_PATTERN = re.compile(r'const CATEGORIES\s*=\s*\[([\s\S]*?)\];')
+ID_PATTERN = re.compile(r'id:\s*[\'"]([^\'"]+)[\'"]')
+MODULES_MARKER = 'SAMPLE_MODULES'
+LINK_PATTERN = re.compile(r'\bhref\s*=\s*[\'"]([^\'"#?]+)[\'"#?]')
+TEMPLATE_LINK_PATTERN = re.compile(r'\bhref\s*=\s*`([^`$]*)\$\{[^}`]*\}([^`$]*)`')
+EXTERNAL_PREFIXES = ('http:', 'https:', '//', 'data:', 'mailto:', 'javascript:')
+ENTRY_PROPERTIES = ('id', 'title', 'category', 'href', 'status')
+PROPERTY_PATTERNS = {
+    name: re.compile(name + r':\s*[\'"]([^\'"]+)[\'"]')
+    for name in ENTRY_PROPERTIES
+}
+
+ROOT_CATEGORY = '(root)'
+NO_INDEX = 'NO INDEX'
+
+# ============================================
+# FILE INDEX
+# ============================================
+
+class SiteIndex:
+    """
+    Persistent, mtime-validated index of every file under the app root.
+
+    files:  rel_path -> [mtime_ns, size]
+    parsed: parser_name -> rel_path -> {'key': [mtime_ns, size], 'data': ...}
+    """
+
+    def __init__(self, app_root=APP_ROOT, index_path=None):
+        self.app_root = Path(app_root)
+        self.index_path = Path(index_path) if index_path else self.app_root / INDEX_FILE
+        self.files = {}
+        self.parsed = {}
+        self._dirty = False
+
+    def load(self):
+        """
+        Load the persisted index, ignoring it if unreadable or stale
+        """
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if data.get('version') != INDEX_VERSION:
+            return False
+
+        self.files = data.get('files', {})
+        self.parsed = data.get('parsed', {})
+        return True
+
+    def save(self):
+        """
+        Persist the index if anything changed since it was loaded
+        """
+        if not self._dirty:
+            return False
+
+        data = {'version': INDEX_VERSION, 'files': self.files, 'parsed': self.parsed}
+        tmp_path = self.index_path.with_name(self.index_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"  WARN: could not write index: {e}", file=sys.stderr)
+            return False
+
+        self._dirty = False
+        return True
+
+    def scan(self):
+        """
+        Walk the app root once and return (added, modified, removed) sets
+        of relative paths compared with the previous index
+        """
+        previous = self.files
+        current = {}
+        stack = ['']
+
+        while stack:
+            rel_dir = stack.pop()
+            abs_dir = self.app_root / rel_dir if rel_dir else self.app_root
+            try:
+                entries = os.scandir(abs_dir)
+            except OSError:
+                continue
+
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    rel = f"{rel_dir}/{name}" if rel_dir else name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if name not in SKIP_DIRS:
+                                stack.append(rel)
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    current[rel] = [st.st_mtime_ns, st.st_size]
+
+        current.pop(INDEX_FILE, None)
+
+        added = current.keys() - previous.keys()
+        removed = previous.keys() - current.keys()
+        modified = {
+            rel for rel in current.keys() & previous.keys()
+            if current[rel] != previous[rel]
+        }
+
+        if added or removed or modified:
+            self._dirty = True
+            for entries in self.parsed.values():
+                for rel in removed:
+                    entries.pop(rel, None)
+
+        self.files = current
+        return added, modified, removed
+
+    def restat(self, rel_paths):
+        """
+        Refresh the stored (mtime_ns, size) of specific files, e.g. after
+        writing them, so the next scan does not report them as changed
+        """
+        for rel in rel_paths:
+            try:
+                st = os.stat(self.app_root / rel)
+            except OSError:
+                continue
+            self.files[rel] = [st.st_mtime_ns, st.st_size]
+            self._dirty = True
+
+    def exists(self, rel_path):
+        """
+        Check a file or directory path against the index without touching disk
+        """
+        rel_path = rel_path.strip('/')
+        if rel_path in self.files:
+            return True
+        prefix = rel_path + '/'
+        return any(rel.startswith(prefix) for rel in self.files)
+
+    def read(self, rel_path):
+        """
+        Read a file relative to the app root
+        """
+        with open(self.app_root / rel_path, 'r', encoding='utf-8', errors='replace') as f:
+            return f.read()
+
+    def cached(self, rel_path, parser):
+        """
+        Return parser(content) for a file, reusing the cached result while
+        the file's (mtime_ns, size) key is unchanged. Results are stored
+        per parser, so different tools can share one index file.
+        """
+        key = self.files.get(rel_path)
+        if key is None:
+            return None
+
+        entries = self.parsed.setdefault(parser.__name__, {})
+        hit = entries.get(rel_path)
+        if hit and hit.get('key') == key:
+            return hit['data']
+
+        data = parser(self.read(rel_path))
+        entries[rel_path] = {'key': key, 'data': data}
+        self._dirty = True
+        return data
+
+    def html_files(self, prefix=''):
+        """
+        All indexed .html paths under a directory prefix
+        """
+        if prefix and not prefix.endswith('/'):
+            prefix += '/'
+        return sorted(
+            rel for rel in self.files
+            if rel.endswith('.html') and rel.startswith(prefix)
+        )
+
+
+def open_index(app_root=APP_ROOT, rebuild=False):
+    """
+    Load (unless rebuilding) and rescan the index; the caller saves it
+    """
+    index = SiteIndex(app_root)
+    if not rebuild:
+        index.load()
+    index.scan()
+    return index
+
+# ============================================
+# PARSERS
+# ============================================
+
+def parse_registry(content):
+    """
+    Extract component file paths from content-registry.js
+    """
+    return REGISTRY_PATH_PATTERN.findall(content)
+
+
+def parse_house_index(content):
+    """
+    Extract hrefs, valid CATEGORIES and SAMPLE_MODULES entries from a
+    house index.html (line-oriented, matching audit-categories.js).
+    Indexes without SAMPLE_MODULES get their hrefs from page links instead.
+    """
+    categories = []
+    categories_match = CATEGORIES_PATTERN.search(content)
+    if categories_match:
+        categories = ID_PATTERN.findall(categories_match.group(1))
+
+    entries = []
+    lines = content.split('\n')
+    for i, line in enumerate(lines):
+        if '{id:' not in line and '{ id:' not in line:
+            continue
+
+        props = {}
+        for name, pattern in PROPERTY_PATTERNS.items():
+            match = pattern.search(line)
+            if match:
+                props[name] = match.group(1)
+
+        # Multi-line entries: look ahead a few lines for the category
+        if 'category' not in props:
+            for next_line in lines[i + 1:i + 6]:
+                match = PROPERTY_PATTERNS['category'].search(next_line)
+                if match:
+                    props['category'] = match.group(1)
+                    break
+                if '{id:' in next_line or next_line.strip() in ('},', '}'):
+                    break
+
+        if 'id' in props:
+            entries.append({'line': i + 1, 'properties': props})
+
+    if MODULES_MARKER in content:
+        hrefs = HREF_PATTERN.findall(content)
+    else:
+        hrefs = parse_page_links(content)
+
+    return {
+        'modules': MODULES_MARKER in content,
+        'hrefs': hrefs,
+        'categories': categories,
+        'entries': entries,
+    }
+
+
+def parse_page_links(content):
+    """
+    Local .html targets of href="..." attributes and location.href='...'
+    assignments, in page order. A template literal such as
+    `modules/${id}.html` becomes the glob modules/*.html.
+    """
+    refs = LINK_PATTERN.findall(content)
+    refs += [prefix + '*' + suffix for prefix, suffix in TEMPLATE_LINK_PATTERN.findall(content)]
+
+    links = []
+    for ref in refs:
+        if ref.startswith(EXTERNAL_PREFIXES) or not ref.endswith('.html'):
+            continue
+        ref = posixpath.normpath(ref)
+        if ref not in links:
+            links.append(ref)
+    return links
+
+
+def is_linked(rel_path, hrefs):
+    """
+    True if a path matches an href exactly or one of its globs
+    """
+    return any(
+        rel_path == href or ('*' in href and fnmatch.fnmatchcase(rel_path, href))
+        for href in hrefs
+    )
+
+# ============================================
+# HOUSES
+# ============================================
+
+def discover_houses(index):
+    """
+    Map house name -> content root (relative to the app root)
+    """
+    names = set()
+    prefix = HOUSES_DIR + '/'
+    for rel in index.files:
+        if rel.startswith(prefix):
+            parts = rel.split('/')
+            if len(parts) > 2:
+                names.add(parts[1])
+
+    houses = {}
+    for name in sorted(names):
+        top_level = any(rel.startswith(name + '/') for rel in index.files)
+        houses[name] = name if top_level else f"{HOUSES_DIR}/{name}"
+    return houses
+
+
+def house_index_path(index, root):
+    """
+    Locate the index.html that lists a house's modules
+    """
+    for candidate in (f"{root}/index.html", f"{root}/vault/index.html"):
+        if candidate in index.files:
+            return candidate
+    return None
+
+
+def select_houses(houses, target):
+    """
+    Restrict to a single house if one was requested (target must be valid)
+    """
+    if not target:
+        return houses
+    return {target: houses[target]}
+
+# ============================================
+# REPORTS
+# ============================================
+
+def report_missing(index):
+    """
+    Registry component paths that do not exist on disk
+    """
+    paths = index.cached(REGISTRY_PATH, parse_registry)
+    if paths is None:
+        raise FileNotFoundError(REGISTRY_PATH)
+
+    missing = [p for p in paths if not index.exists(p)]
+    return {
+        'total': len(paths),
+        'existing': len(paths) - len(missing),
+        'missing': missing,
+    }
+
+
+def report_summary(index, houses):
+    """
+    Count content pages per house and per top-level category directory
+    """
+    result = {}
+    for name, root in houses.items():
+        counts = {}
+        for rel in index.html_files(root):
+            parts = rel[len(root) + 1:].split('/')
+            if parts[-1] == 'index.html':
+                continue
+            category = parts[0] if len(parts) > 1 else ROOT_CATEGORY
+            counts[category] = counts.get(category, 0) + 1
+        result[name] = {
+            'root': root,
+            'categories': dict(sorted(counts.items())),
+            'total': sum(counts.values()),
+        }
+    return result
+
+
+def report_indexes(index, houses):
+    """
+    Files on disk missing from a house index, and index hrefs missing on disk
+    """
+    result = {}
+    for name, root in houses.items():
+        index_path = house_index_path(index, root)
+        if index_path is None:
+            continue
+
+        base = index_path.rsplit('/', 1)[0]
+        hrefs = index.cached(index_path, parse_house_index)['hrefs']
+
+        files = [
+            rel[len(base) + 1:] for rel in index.html_files(base)
+            if not rel.endswith('/index.html')
+        ]
+        orphaned = [f for f in files if hrefs and not is_linked(f, hrefs)]
+        broken = [
+            h for h in hrefs
+            if '*' not in h and not index.exists(posixpath.normpath(f"{base}/{h}"))
+        ]
+
+        if not hrefs:
+            status = NO_INDEX
+        else:
+            status = 'OK' if not orphaned and not broken else 'ISSUES'
+
+        result[name] = {
+            'index': index_path,
+            'files': len(files),
+            'entries': len(hrefs),
+            'orphaned': orphaned,
+            'broken': broken,
+            'status': status,
+        }
+    return result
+
+
+def report_categories(index, houses):
+    """
+    SAMPLE_MODULES entries with a missing or undeclared category
+    """
+    result = {}
+    for name, root in houses.items():
+        index_path = house_index_path(index, root)
+        if index_path is None:
+            continue
+
+        parsed = index.cached(index_path, parse_house_index)
+        valid = set(parsed['categories'])
+        entries = parsed['entries']
+
+        missing = [e for e in entries if 'category' not in e['properties']]
+        invalid = [
+            e for e in entries
+            if 'category' in e['properties'] and e['properties']['category'] not in valid
+        ]
+
+        result[name] = {
+            'index': index_path,
+            'entries': len(entries),
+            'categories': parsed['categories'],
+            'missing_category': missing,
+            'invalid_category': invalid,
+            'missing_status': [e for e in entries if 'status' not in e['properties']],
+            'missing_href': [e for e in entries if 'href' not in e['properties']],
+            'status': 'OK' if not missing and not invalid else 'ISSUES',
+        }
+    return result
+
+
+def report_unregistered(index, houses):
+    """
+    House pages referenced neither by the registry nor by their house index;
+    None for a house without a module index
+    """
+    registered = {
+        posixpath.normpath(p)
+        for p in index.cached(REGISTRY_PATH, parse_registry) or []
+    }
+
+    result = {}
+    for name, root in houses.items():
+        index_path = house_index_path(index, root)
+        hrefs = index.cached(index_path, parse_house_index)['hrefs'] if index_path else []
+        if not hrefs:
+            result[name] = None
+            continue
+
+        base = index_path.rsplit('/', 1)[0]
+        linked = [posixpath.normpath(f"{base}/{href}") for href in hrefs]
+
+        result[name] = [
+            rel for rel in index.html_files(root)
+            if not rel.endswith('/index.html')
+            and rel not in registered
+            and not is_linked(rel, linked)
+        ]
+    return result
+
+
+REPORTS = ('missing', 'summary', 'indexes', 'categories', 'unregistered')
+
+
+def run_reports(index, names, target=None):
+    """
+    Build the requested reports from one index
+    """
+    houses = select_houses(discover_houses(index), target)
+    results = {}
+    for name in names:
+        if name == 'missing':
+            results[name] = report_missing(index)
+        elif name == 'summary':
+            results[name] = report_summary(index, houses)
+        elif name == 'indexes':
+            results[name] = report_indexes(index, houses)
+        elif name == 'categories':
+            results[name] = report_categories(index, houses)
+        elif name == 'unregistered':
+            results[name] = report_unregistered(index, houses)
+    return results
+
+# ============================================
+# TEXT OUTPUT
+# ============================================
+
+def print_missing(report):
+    print("\n=== CONTENT REGISTRY ===")
+    print(f"Total paths referenced: {report['total']}")
+    print(f"Existing:               {report['existing']}")
+    print(f"MISSING:                {len(report['missing'])}")
+    for p in report['missing']:
+        print(f"  ❌ {p}")
+
+
+def print_summary(report):
+    print("\n=== HOUSE CONTENT SUMMARY ===")
+    grand_total = 0
+    for name, house in report.items():
+        grand_total += house['total']
+        print(f"\n{name} ({house['root']}): {house['total']}")
+        for category, count in house['categories'].items():
+            print(f"  {category:<20} {count:>5}")
+    print(f"\nGRAND TOTAL: {grand_total}")
+
+
+def print_indexes(report):
+    print("\n=== HOUSE INDEXES ===")
+    print("| House      | Files | Index | Orphaned | Broken | Status |")
+    print("|------------|-------|-------|----------|--------|--------|")
+    for name, r in report.items():
+        print(f"| {name:<10} | {r['files']:>5} | {r['entries']:>5} | "
+              f"{len(r['orphaned']):>8} | {len(r['broken']):>6} | {r['status']:<6} |")
+    for name, r in report.items():
+        if r['orphaned'] or r['broken']:
+            print(f"\n--- {name.upper()} ---")
+            for f in r['orphaned']:
+                print(f"  📄 orphaned: {f}")
+            for h in r['broken']:
+                print(f"  ❌ broken:   {h}")
+
+
+def print_categories(report):
+    print("\n=== CATEGORY PROPERTIES ===")
+    print("| House      | Entries | Missing Cat | Invalid Cat | Status |")
+    print("|------------|---------|-------------|-------------|--------|")
+    for name, r in report.items():
+        print(f"| {name:<10} | {r['entries']:>7} | {len(r['missing_category']):>11} | "
+              f"{len(r['invalid_category']):>11} | {r['status']:<6} |")
+    for name, r in report.items():
+        if r['missing_category'] or r['invalid_category']:
+            print(f"\n--- {name.upper()} ---")
+            print(f"Valid categories: {', '.join(r['categories'])}")
+            for e in r['missing_category']:
+                print(f"  Line {e['line']}: {e['properties']['id']} (no category)")
+            for e in r['invalid_category']:
+                print(f"  Line {e['line']}: {e['properties']['id']} "
+                      f"(\"{e['properties']['category']}\" not in CATEGORIES)")
+
+
+def print_unregistered(report):
+    print("\n=== UNREGISTERED PAGES ===")
+    for name, pages in report.items():
+        if pages is None:
+            print(f"{name}: no module index")
+            continue
+        print(f"{name}: {len(pages)}")
+        for rel in pages:
+            print(f"  📄 {rel}")
+
+
+PRINTERS = {
+    'missing': print_missing,
+    'summary': print_summary,
+    'indexes': print_indexes,
+    'categories': print_categories,
+    'unregistered': print_unregistered,
+}
+
+# ============================================
+# CLI
+# ============================================
+
+def print_help():
+    print("""
+site_audit.py - Audit _app content from a cached file index
+
+Usage:
+    python3 site_audit.py [report] [house] [--json] [--rebuild]
+
+Reports:
+    missing        Registry component paths missing on disk
+    summary        Per-house, per-category page counts
+    indexes        Orphaned files / broken hrefs in house index.html
+    categories     SAMPLE_MODULES entries with missing or invalid category
+    unregistered   Pages referenced by neither the registry nor an index
+    all            Every report above (default)
+
+Options:
+    --json         Emit machine-readable JSON
+    --rebuild      Discard the cached index and rescan
+""")
+
+
+def main():
+    args = sys.argv[1:]
+
+    if '--help' in args or '-h' in args:
+        print_help()
+        return 0
+
+    as_json = '--json' in args
+    rebuild = '--rebuild' in args
+    positional = [a for a in args if not a.startswith('--')]
+
+    names = list(REPORTS)
+    if positional and positional[0] in REPORTS + ('all',):
+        if positional[0] != 'all':
+            names = [positional[0]]
+        positional = positional[1:]
+    target = positional[0] if positional else None
+
+    started = time.perf_counter()
+    index = open_index(APP_ROOT, rebuild)
+
+    houses = discover_houses(index)
+    if target and target not in houses:
+        print(f"ERROR: unknown house '{target}'. Valid houses: {', '.join(houses)}",
+              file=sys.stderr)
+        index.save()
+        return 2
+
+    try:
+        results = run_reports(index, names, target)
+    except FileNotFoundError as e:
+        print(f"ERROR: {e} not found under {APP_ROOT}", file=sys.stderr)
+        return 2
+
+    index.save()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if as_json:
+        json.dump({'elapsed_ms': round(elapsed_ms, 1), 'reports': results},
+                  sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    else:
+        for name in names:
+            PRINTERS[name](results[name])
+        print(f"\nIndexed {len(index.files)} files in {elapsed_ms:.0f} ms")
+
+    missing = results.get('missing', {}).get('missing')
+    return 1 if missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+site_watch.py - Debounced incremental rebuild loop for the build tools
+
+Polls the SiteIndex (see site_audit.py) for changed files under _app and
+hands only the affected HTML pages to a rebuild callback:
+
+1. Changed or added .html pages are rebuilt directly
+2. With follow_dependents=True, changed components (.js/.css/...) also
+   rebuild every page that references them via src= or href=, for tools
+   whose output depends on component contents (fingerprinting, inlining)
+
+Neither content-encoder.py nor inject-access-guard.py fingerprints; both
+skip pages they have already processed, so they watch pages only.
+
+Bursts of saves are coalesced: a rebuild only runs once no new change has
+been seen for the debounce window. Files written by the rebuild itself are
+re-stamped in the index so they do not trigger another pass.
+
+Used by content-encoder.py and inject-access-guard.py via --watch, or
+directly:
+
+    from site_watch import watch
+    watch(app_root, ['houses', 'dark-arts'], rebuild_pages)
+
+@author Hexworth Prime
+@version 1.0.0
+"""
+
+import re
+import sys
+import time
+import posixpath
+from pathlib import Path
+
+from site_audit import SiteIndex
+
+# Configuration
+POLL_INTERVAL = 0.25    # seconds between scans
+DEBOUNCE = 0.3          # quiet period before rebuilding
+
+# Local asset references in a page
+REF_PATTERN = re.compile(r'(?:src|href)\s*=\s*["\']([^"\'#?]+)', re.IGNORECASE)
+EXTERNAL_PREFIXES = ('http:', 'https:', '//', 'data:', 'mailto:', 'javascript:')
+
+# ============================================
+# DEPENDENCY GRAPH
+# ============================================
+
+def parse_refs(content):
+    """
+    Raw local src/href targets in an HTML page
+    """
+    return sorted({
+        ref for ref in REF_PATTERN.findall(content)
+        if not ref.startswith(EXTERNAL_PREFIXES)
+    })
+
+
+def resolve_ref(page, ref):
+    """
+    Resolve a ref relative to the page, as a path relative to the app root
+    """
+    base = posixpath.dirname(page)
+    return posixpath.normpath(posixpath.join(base, ref))
+
+
+class DependencyGraph:
+    """
+    Reverse map from asset path -> pages that reference it
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self.refs = {}
+        self.dependents = {}
+
+    def update(self, page):
+        """
+        (Re)compute a page's references from the index parse cache
+        """
+        self.remove(page)
+        raw = self.index.cached(page, parse_refs) or []
+        targets = {resolve_ref(page, ref) for ref in raw}
+        self.refs[page] = targets
+        for target in targets:
+            self.dependents.setdefault(target, set()).add(page)
+
+    def remove(self, page):
+        for target in self.refs.pop(page, ()):
+            pages = self.dependents.get(target)
+            if pages:
+                pages.discard(page)
+
+    def build(self, pages):
+        for page in pages:
+            self.update(page)
+
+    def pages_for(self, rel_path):
+        return self.dependents.get(rel_path, set())
+
+# ============================================
+# WATCH LOOP
+# ============================================
+
+def in_roots(rel_path, roots):
+    return not roots or any(rel_path.startswith(root + '/') for root in roots)
+
+
+def affected_pages(graph, changed, removed, roots, follow_dependents=False):
+    """
+    Pages to rebuild for a set of changed and removed paths
+    """
+    pages = set()
+    for rel in changed:
+        if rel.endswith('.html'):
+            pages.add(rel)
+            if follow_dependents:
+                graph.update(rel)
+        if follow_dependents:
+            pages.update(graph.pages_for(rel))
+
+    for rel in removed:
+        if rel.endswith('.html'):
+            graph.remove(rel)
+            pages.discard(rel)
+        elif follow_dependents:
+            pages.update(graph.pages_for(rel))
+
+    return sorted(p for p in pages if in_roots(p, roots) and p in graph.index.files)
+
+
+def watch(app_root, roots, rebuild, interval=POLL_INTERVAL, debounce=DEBOUNCE,
+          follow_dependents=False):
+    """
+    Poll app_root forever, calling rebuild(list_of_paths) with absolute
+    Paths of pages under roots that need rebuilding; rebuild returns how
+    many of them it actually changed. Set follow_dependents when the
+    rebuild's output depends on the components a page references.
+    """
+    index = SiteIndex(app_root)
+    index.load()
+    index.scan()
+    graph = DependencyGraph(index)
+    if follow_dependents:
+        graph.build(index.html_files())
+    index.save()
+
+    print(f"Watching {len(index.files)} files under {app_root} (Ctrl+C to stop)")
+
+    pending_changed = set()
+    pending_removed = set()
+    last_change = None
+
+    try:
+        while True:
+            time.sleep(interval)
+            added, modified, removed = index.scan()
+
+            if added or modified or removed:
+                pending_changed |= added | modified
+                pending_changed -= removed
+                pending_removed |= removed
+                pending_removed -= added
+                last_change = time.monotonic()
+                continue
+
+            if last_change is None or time.monotonic() - last_change < debounce:
+                continue
+
+            started = time.perf_counter()
+            pages = affected_pages(graph, pending_changed, pending_removed, roots,
+                                   follow_dependents)
+            pending_changed = set()
+            pending_removed = set()
+            last_change = None
+
+            rebuilt = 0
+            if pages:
+                rebuilt = rebuild([index.app_root / rel for rel in pages]) or 0
+                index.restat(pages)
+                if follow_dependents:
+                    for rel in pages:
+                        graph.update(rel)
+
+            index.save()
+            if rebuilt:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                print(f"  Rebuilt {rebuilt} page(s) in {elapsed_ms:.0f} ms")
+    except KeyboardInterrupt:
+        index.save()
+        print("\nStopped watching.")
+
+
+def print_pages(paths):
+    for path in paths:
+        print(f"  CHANGED: {path}")
+
+
+if __name__ == "__main__":
+    # Dry watch: report which pages would be rebuilt, including pages that
+    # reference a changed component, e.g.
+    #   python3 site_watch.py houses/shield dark-arts
+    watch(Path(__file__).parent.parent, sys.argv[1:], print_pages,
+          follow_dependents=True)
@@ -3,12 +3,16 @@
 Update all quiz files to include the Progress System
 """
 
-import os
-import re
+import sys
 from pathlib import Path
 
+# hexworth_build lives in _app/tools
+sys.path.insert(0, str(Path(__file__).resolve().parent / "_app" / "tools"))
+
+from hexworth_build import HOUSES_DIR, DocumentError, DocumentStore, add_progress_tracking
+
 # Base path
-BASE_PATH = Path("/home/eq/Ai content creation/Hexworth Prime/_app/houses")
+BASE_PATH = HOUSES_DIR
 
 # Map quiz files to their module IDs and house IDs
 QUIZ_MAPPINGS = {
@@ -56,7 +60,7 @@ QUIZ_MAPPINGS = {
 }
 
 
-def update_quiz_file(filepath, module_id, house_id):
+def update_quiz_file(store, filepath, module_id, house_id):
     """Update a single quiz file with progress system integration"""
     full_path = BASE_PATH / filepath
 
@@ -64,38 +68,18 @@ def update_quiz_file(filepath, module_id, house_id):
         print(f"  SKIP: {filepath} (file not found)")
         return False
 
-    content = full_path.read_text()
-
-    # Check if already updated
-    if "ProgressSystem.js" in content:
-        print(f"  SKIP: {filepath} (already updated)")
+    try:
+        result = add_progress_tracking(store.get(full_path), module_id, house_id)
+    except DocumentError as e:
+        print(f"  {e}: {filepath}")
         return False
 
-    # Add ProgressSystem.js before QuizEngine.js
-    content = re.sub(
-        r'(<!-- Quiz Engine -->)\s*\n\s*(<script src="[^"]*QuizEngine\.js"></script>)',
-        r'<!-- Progress System (loads ProgressManager, AchievementSystem, LearningPaths, SkillTreeData) -->\n    <script src="../../../components/ProgressSystem.js"></script>\n\n    \1\n    \2',
-        content
-    )
-
-    # Add moduleId, houseId, trackProgress to quiz config
-    # Look for the QuizEngine config and add after theme or achievement
-    config_pattern = r"(theme:\s*'[^']*',\s*\n\s*)(achievement:\s*'[^']*',)"
-    replacement = rf"\1\2\n            // Progress tracking\n            moduleId: '{module_id}',\n            houseId: '{house_id}',\n            trackProgress: true,"
-
-    if re.search(config_pattern, content):
-        content = re.sub(config_pattern, replacement, content)
-    else:
-        # Try alternative pattern - just add after theme
-        config_pattern2 = r"(theme:\s*'[^']*',)"
-        replacement2 = rf"\1\n            // Progress tracking\n            moduleId: '{module_id}',\n            houseId: '{house_id}',\n            trackProgress: true,"
-        if re.search(config_pattern2, content):
-            content = re.sub(config_pattern2, replacement2, content)
-        else:
-            print(f"  WARN: {filepath} (could not find config pattern)")
+    if not result.changed:
+        print(f"  SKIP: {filepath} ({result.detail})")
+        return False
 
-    full_path.write_text(content)
-    print(f"  UPDATED: {filepath}")
+    if result.detail == 'no config':
+        print(f"  WARN: {filepath} (could not find config pattern)")
     return True
 
 
@@ -106,12 +90,21 @@ def main():
     updated = 0
     skipped = 0
 
+    store = DocumentStore()
     for filepath, config in QUIZ_MAPPINGS.items():
-        if update_quiz_file(filepath, config["moduleId"], config["houseId"]):
+        if update_quiz_file(store, filepath, config["moduleId"], config["houseId"]):
             updated += 1
         else:
             skipped += 1
 
+    written, errors = store.commit()
+    for doc in written:
+        print(f"  UPDATED: {doc.path.relative_to(BASE_PATH)}")
+    for e in errors:
+        print(f"  {e}: {e.path.relative_to(BASE_PATH)}")
+    updated -= len(errors)
+    skipped += len(errors)
+
     print("-" * 50)
     print(f"Done! Updated: {updated}, Skipped: {skipped}")
 